@@ -1,13 +1,189 @@
 # app/data_loader.py
 import os
+import csv
+import tempfile
+import asyncio
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+import numpy as np
 import pandas as pd
-from typing import Optional, Dict
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+from typing import Any, Optional, Dict, List, Callable, Iterator, Tuple
 from datetime import datetime
 import logging
 
 logger = logging.getLogger("data_loader")
 logger.setLevel(logging.INFO)
 
+# output format for timestamp columns in API responses (second precision)
+TS_FORMAT = "%Y-%m-%dT%H:%M:%S"
+
+# os.umask() can only be read by setting it, so do that once at import rather than per (threaded) cache write
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def _types_mapper(arrow_type: pa.DataType) -> Optional[pd.ArrowDtype]:
+    # parsed *_ts columns stay numpy datetime64[ns] and dictionary columns become Categorical;
+    # everything else is Arrow-backed
+    if pa.types.is_timestamp(arrow_type) or pa.types.is_dictionary(arrow_type):
+        return None
+    return pd.ArrowDtype(arrow_type)
+
+
+class TableView:
+    """
+    Cached Arrow table whose derived (numeric / *_ts) columns are only computed on first access.
+    `derived` maps output column -> (source column, converter); a derived column may replace its source.
+    """
+
+    def __init__(
+        self,
+        arrow: pa.Table,
+        derived: Optional[Dict[str, Tuple[str, Callable[[pa.ChunkedArray], pa.ChunkedArray]]]] = None,
+        datetime_cols: Tuple[str, ...] = (),
+    ):
+        self.arrow = arrow
+        self.derived = derived or {}
+        self.materialized: Dict[str, pa.ChunkedArray] = {}
+        self.datetime_cols = datetime_cols
+        # set by sort_by(); sort_keys holds the non-null timestamp keys as int64 ns for searchsorted
+        self.sorted_by: Optional[str] = None
+        self.sort_keys: Optional[np.ndarray] = None
+        # assembled by to_table() once and reused by every page; pages only ever read from it
+        self._table: Optional[pa.Table] = None
+
+    def __len__(self) -> int:
+        return self.arrow.num_rows
+
+    @property
+    def nbytes(self) -> int:
+        """Arrow buffer size of the base table plus everything materialized so far."""
+        return self.arrow.nbytes + sum(col.nbytes for col in self.materialized.values())
+
+    @property
+    def column_names(self) -> List[str]:
+        names = list(self.arrow.column_names)
+        return names + [c for c in self.derived if c not in names]
+
+    def column(self, name: str) -> pa.ChunkedArray:
+        """Return a column, materializing (and caching) derived columns on first access."""
+        if name in self.derived:
+            if name not in self.materialized:
+                source, convert = self.derived[name]
+                self.materialized[name] = convert(self.arrow.column(source))
+            return self.materialized[name]
+        return self.arrow.column(name)
+
+    def to_table(self) -> pa.Table:
+        """Fully materialized table; derived *_ts columns that parsed to all-null are dropped."""
+        if self._table is not None:
+            return self._table
+        columns, names = [], []
+        for name in self.column_names:
+            col = self.column(name)
+            if name in self.derived and name not in self.arrow.column_names and col.null_count == len(col):
+                continue
+            columns.append(col)
+            names.append(name)
+        self._table = pa.Table.from_arrays(columns, names=names)
+        return self._table
+
+    def sort_by(self, name: str, presorted: bool = False) -> None:
+        """
+        Reorder rows in place by `name` (stable, nulls last); materialized columns are reordered too.
+        `presorted` only records the order (e.g. a Parquet cache that was written sorted).
+        """
+        if not presorted:
+            indices = pc.sort_indices(self.column(name), null_placement="at_end")
+            self.arrow = self.arrow.take(indices)
+            self.materialized = {c: col.take(indices) for c, col in self.materialized.items()}
+            self._table = None
+        self.sorted_by = name
+        col = self.column(name)
+        if pa.types.is_timestamp(col.type):
+            # nulls sort last, so the valid keys are a monotonic prefix of the column
+            self.sort_keys = pc.cast(col.drop_null(), pa.timestamp("ns")).to_numpy().view("i8")
+
+    def slice(self, offset: int, length: int) -> "TableView":
+        """Contiguous row range as a new (already materialized) view."""
+        return TableView(
+            self.to_table().slice(offset, length),
+            datetime_cols=self.datetime_cols,
+        )
+
+    def take(self, indices: np.ndarray) -> "TableView":
+        """Row subset (by position) as a new (already materialized) view."""
+        return TableView(
+            self.to_table().take(pa.array(indices, type=pa.int64())),
+            datetime_cols=self.datetime_cols,
+        )
+
+    def to_pandas_slice(self, offset: int = 0, limit: Optional[int] = None) -> pd.DataFrame:
+        """Convert rows [offset, offset + limit) to pandas; slicing an Arrow table is O(1) metadata."""
+        return self.to_table().slice(offset, limit).to_pandas(types_mapper=_types_mapper)
+
+    def to_pylist(self, offset: int = 0, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Rows [offset, offset + limit) as JSON-ready dicts, built by Arrow.
+        Timestamps are formatted on the sliced page only, so the full columns stay usable for filtering.
+        """
+        page = self.to_table().slice(offset, limit)
+        for name in self.datetime_cols:
+            if name in page.column_names:
+                i = page.column_names.index(name)
+                # floor, not truncate toward zero: pre-1970 fractional seconds must not round up a second
+                seconds = pc.cast(pc.floor_temporal(page.column(i), unit="second"), pa.timestamp("s"))
+                page = page.set_column(i, name, pc.strftime(seconds, format=TS_FORMAT))
+        return page.to_pylist()
+
+    def iter_pylist(self, batch_size: int = 10_000) -> Iterator[List[Dict[str, Any]]]:
+        """to_pylist() in batches of `batch_size` rows, so callers never hold the whole table as dicts."""
+        for offset in range(0, len(self), batch_size):
+            yield self.to_pylist(offset, batch_size)
+
+
+class TableCache:
+    """
+    Thread-safe LRU of TableViews bounded by their total Arrow buffer size.
+    Sizes are re-read on every insert since views grow as derived columns get materialized.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, TableView]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __contains__(self, table_name: str) -> bool:
+        with self._lock:
+            return table_name in self._entries
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def get(self, table_name: str) -> Optional[TableView]:
+        with self._lock:
+            view = self._entries.get(table_name)
+            if view is not None:
+                self._entries.move_to_end(table_name)
+            return view
+
+    def put(self, table_name: str, view: TableView) -> None:
+        with self._lock:
+            self._entries[table_name] = view
+            self._entries.move_to_end(table_name)
+            total = sum(v.nbytes for v in self._entries.values())
+            # never evict the entry just inserted, even if it alone exceeds the budget
+            while total > self.max_bytes and len(self._entries) > 1:
+                evicted, old = self._entries.popitem(last=False)
+                total -= old.nbytes
+                logger.info(f"Evicted table '{evicted}' from cache ({old.nbytes} bytes, {total} bytes still cached)")
+
 
 class DataLoader:
     """
@@ -27,115 +203,377 @@ class DataLoader:
         "updated_at",
     ]
 
+    NUMERIC_FIELDS = frozenset({
+        "detention_minutes",
+        "gallons",
+        "price_per_gallon",
+        "total_cost",
+        "total_miles",
+        "average_mpg",
+        "labor_cost",
+        "parts_cost",
+        "downtime_hours",
+    })
+
+    # tried in priority order when a date column is not clean ISO-8601
+    DATE_FORMATS = ("%Y-%m-%dT%H:%M:%S", "%Y-%m-%d %H:%M:%S", "%Y-%m-%d", "%Y-%m")
+    # the ISO-8601 shapes Arrow's string -> timestamp cast accepts, without and with a UTC offset
+    ISO_NAIVE_RE = r"^\d{4}-\d{2}-\d{2}([T ]\d{2}(:\d{2}(:\d{2}(\.\d{1,9})?)?)?)?$"
+    ISO_OFFSET_RE = r"^\d{4}-\d{2}-\d{2}[T ]\d{2}(:\d{2}(:\d{2}(\.\d{1,9})?)?)?(Z|[+-]\d{2}(:?\d{2})?)$"
+
+    # bump whenever the layout of the Parquet side-cache changes; files without it are rebuilt
+    CACHE_VERSION = "3"
+
+    # string columns with distinct/rows below this are stored dictionary-encoded
+    DICTIONARY_MAX_RATIO = 0.3
+
     BOOL_TRUE = {"true", "True", "TRUE", "1", "yes", "Yes", "Y"}
     BOOL_FALSE = {"false", "False", "FALSE", "0", "no", "No", "N"}
 
-    def __init__(self, data_dir: str = "data"):
+    def __init__(self, data_dir: str = "data", cache_max_bytes: int = 1024 * 1024 * 1024):
         self.data_dir = data_dir
-        self.cache: Dict[str, pd.DataFrame] = {}
+        self.cache = TableCache(cache_max_bytes)
+        # one lock per table so concurrent first hits share a single parse
+        self._locks: Dict[str, asyncio.Lock] = {}
+        # metadata memoized per instance; the mtime arguments are the invalidation keys
+        self._list_tables_cached = lru_cache(maxsize=1)(self._scan_tables)
+        self._schema_cached = lru_cache(maxsize=32)(self._compute_schema)
+        # per-table facts that don't change between requests: sort_col, datetime_cols, CSV mtime/size, ingest_ts
+        self.meta: Dict[str, Dict[str, Any]] = {}
+        self._bool_true = pa.array(sorted(self.BOOL_TRUE))
+        self._bool_false = pa.array(sorted(self.BOOL_FALSE))
 
     def _local_path(self, table_name: str) -> str:
         return os.path.join(self.data_dir, f"{table_name}.csv")
 
+    def _parquet_path(self, table_name: str) -> str:
+        return os.path.join(self.data_dir, ".cache", f"{table_name}.parquet")
+
+    def _read_header(self, path: str) -> List[str]:
+        # utf-8-sig drops a leading BOM, matching the column names Arrow's reader produces
+        with open(path, newline="", encoding="utf-8-sig") as fh:
+            return next(csv.reader(fh), [])
+
+    def _read_csv(self, path: str) -> pa.Table:
+        """Parse CSV with Arrow's multithreaded reader; every column is kept as (trimmed) string."""
+        header = self._read_header(path)
+        skipped = []
+
+        def skip_invalid_row(row) -> str:
+            # a row with the wrong number of fields shouldn't make the whole table unusable
+            skipped.append(row)
+            return "skip"
+
+        table = pacsv.read_csv(
+            path,
+            read_options=pacsv.ReadOptions(use_threads=True, block_size=8 * 1024 * 1024),
+            parse_options=pacsv.ParseOptions(delimiter=",", invalid_row_handler=skip_invalid_row),
+            convert_options=pacsv.ConvertOptions(
+                column_types={c: pa.string() for c in header},
+                strings_can_be_null=True,
+                null_values=[""],
+            ),
+        )
+        if skipped:
+            first = skipped[0]
+            logger.warning(
+                f"Skipped {len(skipped)} malformed row(s) in {path}; first: expected {first.expected_columns} "
+                f"columns, got {first.actual_columns}: {first.text!r}"
+            )
+        # normalize column names: strip whitespace
+        table = table.rename_columns([c.strip() for c in table.column_names])
+        # basic trimming for all string columns to clean spacing (vectorized, before pandas conversion)
+        for i, field in enumerate(table.schema):
+            if pa.types.is_string(field.type):
+                table = table.set_column(i, field.name, pc.utf8_trim_whitespace(table.column(i)))
+        return table
+
     def list_tables(self):
-        """List CSV files in data_dir (names without .csv)."""
-        files = []
+        """List CSV files in data_dir (names without .csv); rescanned only when the directory mtime changes."""
         if not os.path.isdir(self.data_dir):
-            return files
+            return []
+        return list(self._list_tables_cached(os.stat(self.data_dir).st_mtime))
+
+    def _scan_tables(self, dir_mtime: float) -> Tuple[str, ...]:
+        files = []
         for f in os.listdir(self.data_dir):
             if f.lower().endswith(".csv"):
                 files.append(os.path.splitext(f)[0])
-        return sorted(files)
+        return tuple(sorted(files))
 
     def get_schema(self, table_name: str) -> Dict[str, str]:
         """Return simple schema (column -> dtype) using pandas inference (may be approximate)."""
-        df = self.load_table(table_name)
+        path = self._local_path(table_name)
+        if not os.path.exists(path):
+            raise FileNotFoundError(path)
+        return dict(self._schema_cached(table_name, os.path.getmtime(path)))
+
+    def _compute_schema(self, table_name: str, csv_mtime: float) -> Dict[str, str]:
+        df = self.load_table(table_name).to_pandas_slice(0, 0)
         return {c: str(dtype) for c, dtype in df.dtypes.items()}
 
-    def load_table(self, table_name: str) -> pd.DataFrame:
-        """Load CSV and run lightweight normalization. Caches result in memory."""
-        if table_name in self.cache:
-            return self.cache[table_name]
+    def load_table(self, table_name: str) -> TableView:
+        """Load CSV with read+trim normalization only; numeric/date coercion is deferred. Caches result in memory."""
+        cached = self.cache.get(table_name)
+        if cached is not None:
+            return cached
 
+        view = self._build_view(table_name)
+        self.cache.put(table_name, view)
+        return view
+
+    def ensure_parquet(self, table_name: str) -> bool:
+        """Build the Parquet side-cache if it is missing or stale, without keeping the table in memory."""
         path = self._local_path(table_name)
         if not os.path.exists(path):
             raise FileNotFoundError(path)
+        if self._parquet_is_fresh(self._parquet_path(table_name), os.path.getmtime(path)):
+            return False
+        self._build_view(table_name)
+        return True
 
-        # read as string first to avoid dtype surprises
-        df = pd.read_csv(path, dtype=str, keep_default_na=False, na_values=[""])
-        # normalize column names: strip whitespace
-        df.columns = [c.strip() for c in df.columns]
+    def _parquet_is_fresh(self, parquet_path: str, csv_mtime: float) -> bool:
+        """True if the side-cache is newer than the CSV, opens, and was written with the current CACHE_VERSION."""
+        if not os.path.exists(parquet_path) or os.path.getmtime(parquet_path) < csv_mtime:
+            return False
+        try:
+            # footer only; catches truncated files and older layouts without reading the data
+            metadata = pq.read_schema(parquet_path).metadata or {}
+        except Exception:
+            logger.warning(f"Could not read parquet cache {parquet_path}", exc_info=True)
+            return False
+        if metadata.get(b"cache_version", b"").decode() != self.CACHE_VERSION:
+            # written by an older layout (e.g. already-converted numerics): don't reinterpret it
+            logger.info(f"Ignoring parquet cache {parquet_path} with an outdated layout")
+            return False
+        return True
+
+    def _build_view(self, table_name: str) -> TableView:
+        path = self._local_path(table_name)
+        if not os.path.exists(path):
+            raise FileNotFoundError(path)
+        # stat once: used for the Parquet freshness check and kept in meta for ETags
+        stat = os.stat(path)
 
-        # basic trimming for all string columns to clean spacing
-        for c in df.select_dtypes(include="object").columns:
-            df[c] = df[c].astype(str).str.strip()
+        parquet_path = self._parquet_path(table_name)
+        sorted_by, stored_sort_col = "", None
+        table, source = None, path
+        if self._parquet_is_fresh(parquet_path, stat.st_mtime):
+            # warm path: skips the CSV parse, trim and boolean normalization
+            try:
+                table = pq.read_table(parquet_path, use_threads=True)
+                source = parquet_path
+            except Exception:
+                # footer was fine but the data isn't (or the file changed underneath): fall back to the CSV,
+                # which also rewrites it
+                logger.warning(f"Could not read parquet cache {parquet_path}", exc_info=True)
+        if table is not None:
+            sorted_by = (table.schema.metadata or {}).get(b"sorted_by", b"").decode()
+            if sorted_by in table.column_names:
+                # the parsed sort column is stored too, so the warm path doesn't re-parse it
+                stored_sort_col = table.column(sorted_by)
+                table = table.drop_columns([sorted_by])
+        else:
+            table = self._parse_table(path)
 
-        # normalize boolean-like columns (example on_time_flag)
-        if "on_time_flag" in df.columns:
-            df["on_time_flag"] = df["on_time_flag"].apply(self._to_bool_str)
+        derived = self._derived_columns(table)
+        datetime_cols = tuple(c for c in derived if c.endswith("_ts"))
+        view = TableView(table, derived, datetime_cols=datetime_cols)
+        if stored_sort_col is not None and sorted_by in derived:
+            view.materialized[sorted_by] = stored_sort_col
+        sort_col = self._primary_date_col(view)
+        self.meta[table_name] = {
+            # same column filter_by_date picks, so its binary-search path applies
+            "sort_col": sort_col,
+            "datetime_cols": datetime_cols,
+            "mtime": stat.st_mtime,
+            "size": stat.st_size,
+            # ingest timestamp for auditing; one scalar per load instead of a constant column
+            "ingest_ts": datetime.utcnow().isoformat(),
+        }
 
-        # attempt numeric conversion for common numeric fields
-        for num_col in [
-            "detention_minutes",
-            "gallons",
-            "price_per_gallon",
-            "total_cost",
-            "total_miles",
-            "average_mpg",
-            "labor_cost",
-            "parts_cost",
-            "downtime_hours",
-        ]:
-            if num_col in df.columns:
-                df[num_col] = pd.to_numeric(df[num_col], errors="coerce")
+        # sort once here so every paginated request is a plain slice; the Parquet cache is written sorted
+        if sort_col:
+            view.sort_by(sort_col, presorted=sorted_by == sort_col)
+        if source == path:
+            self._write_parquet(view, parquet_path, sort_col)
+        logger.info(f"Loaded table '{table_name}' shape={(len(view), len(view.column_names))} from {source}")
+        return view
 
+    async def aload_table(self, table_name: str) -> TableView:
+        """Async load_table: parses in a worker thread, and concurrent callers wait for the same parse."""
+        cached = self.cache.get(table_name)
+        if cached is not None:
+            return cached
+        async with self._locks.setdefault(table_name, asyncio.Lock()):
+            cached = self.cache.get(table_name)
+            if cached is not None:
+                return cached
+            return await asyncio.to_thread(self.load_table, table_name)
+
+    def _derived_columns(self, table: pa.Table) -> Dict[str, Tuple[str, Callable[[pa.ChunkedArray], pa.ChunkedArray]]]:
+        derived = {}
+        # attempt numeric conversion for common numeric fields
+        for name in table.column_names:
+            if name in self.NUMERIC_FIELDS:
+                derived[name] = (name, self._to_numeric)
         # attempt to parse dates for known date columns and store parsed version with suffix _ts
         for dcol in self.DATE_CANDIDATES:
-            if dcol in df.columns:
-                parsed = pd.to_datetime(df[dcol], errors="coerce", infer_datetime_format=True)
-                parsed_col = f"{dcol}_ts"
-                if parsed.notna().sum() > 0:
-                    df[parsed_col] = parsed
-
-        # add ingest timestamp column for auditing
-        df["_ingest_ts"] = datetime.utcnow().isoformat()
-
-        logger.info(f"Loaded table '{table_name}' shape={df.shape} from {path}")
-        self.cache[table_name] = df
-        return df
-
-    def _to_bool_str(self, val: Optional[str]) -> str:
-        if val is None:
-            return ""
-        s = str(val).strip()
-        if s in self.BOOL_TRUE:
-            return "true"
-        if s in self.BOOL_FALSE:
-            return "false"
-        return s  # leave original if unknown
-
-    def filter_by_date(self, df: pd.DataFrame, start_date: Optional[str], end_date: Optional[str]) -> pd.DataFrame:
+            if dcol in table.column_names:
+                derived[f"{dcol}_ts"] = (dcol, self._to_timestamp)
+        return derived
+
+    def _write_parquet(self, view: TableView, parquet_path: str, sorted_by: Optional[str] = None) -> None:
+        """
+        Persist the trimmed table (plus the parsed sort column) as a Parquet side-cache.
+        Failures only cost the warm start.
+        """
+        table = view.arrow
+        metadata = {**(table.schema.metadata or {}), b"cache_version": self.CACHE_VERSION.encode()}
+        if sorted_by:
+            table = table.append_column(sorted_by, view.column(sorted_by))
+            metadata[b"sorted_by"] = sorted_by.encode()
+        table = table.replace_schema_metadata(metadata)
+        tmp_path = None
+        try:
+            cache_dir = os.path.dirname(parquet_path)
+            os.makedirs(cache_dir, exist_ok=True)
+            # write next to the target and swap it in, so readers never see a half-written file
+            fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+            # mkstemp creates the file 0600; give it the mode open() would, so other users can still read the cache
+            os.fchmod(fd, 0o666 & ~_UMASK)
+            os.close(fd)
+            pq.write_table(
+                table,
+                tmp_path,
+                compression="zstd",
+                use_dictionary=True,
+            )
+            os.replace(tmp_path, parquet_path)
+        except Exception:
+            logger.warning(f"Could not write parquet cache {parquet_path}", exc_info=True)
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def _parse_table(self, path: str) -> pa.Table:
+        """Parse the CSV and apply the (cheap) boolean normalization."""
+        # read as string first to avoid dtype surprises
+        table = self._read_csv(path)
+
+        # normalize boolean-like columns (example on_time_flag); unknown values are left as-is
+        if "on_time_flag" in table.column_names:
+            i = table.column_names.index("on_time_flag")
+            col = table.column(i)
+            col = pc.if_else(pc.is_in(col, value_set=self._bool_true), "true", col)
+            col = pc.if_else(pc.is_in(col, value_set=self._bool_false), "false", col)
+            table = table.set_column(i, "on_time_flag", col)
+
+        # dictionary-encode low-cardinality string columns (status, city, state, ...); IDs and the
+        # numeric/date sources are skipped since they are unique-ish or converted anyway
+        skip = self.NUMERIC_FIELDS.union(self.DATE_CANDIDATES)
+        for i, field in enumerate(table.schema):
+            if not pa.types.is_string(field.type) or field.name in skip or field.name.endswith("_id"):
+                continue
+            col = table.column(i)
+            if len(col) and pc.count_distinct(col).as_py() / len(col) < self.DICTIONARY_MAX_RATIO:
+                table = table.set_column(i, field.name, pc.dictionary_encode(col))
+
+        return table
+
+    @staticmethod
+    def _to_numeric(col: pa.ChunkedArray) -> pa.ChunkedArray:
+        """Cast a string column to int64 (all integral) or float64; unparseable values become null."""
+        if not pa.types.is_string(col.type):
+            # already typed (never produced by _parse_table): an unsafe cast here could truncate
+            return col
+        try:
+            return pc.cast(col, pa.int64(), safe=False)
+        except pa.ArrowInvalid:
+            pass
+        try:
+            out = pc.cast(col, pa.float64(), safe=False)
+        except pa.ArrowInvalid:
+            coerced = pd.to_numeric(col.to_pandas(), errors="coerce")
+            return pa.chunked_array([pa.array(coerced, type=pa.float64(), from_pandas=True)])
+        # literal "nan" strings become null, like the unparseable ones
+        return pc.if_else(pc.is_nan(out), pa.scalar(None, pa.float64()), out)
+
+    def _to_timestamp(self, col: pa.ChunkedArray) -> pa.ChunkedArray:
+        """
+        Parse a string column to timestamp[ns], value by value: ISO-8601 first (offsets are converted to naive UTC),
+        then DATE_FORMATS for what is left; cells nothing accepts become null.
+        """
+        try:
+            # fast path: every value is naive ISO-8601
+            return pc.cast(col, pa.timestamp("ns"))
+        except pa.ArrowInvalid:
+            pass
+        naive = pc.match_substring_regex(col, self.ISO_NAIVE_RE)
+        offset = pc.match_substring_regex(col, self.ISO_OFFSET_RE)
+        out = pc.coalesce(
+            self._cast_iso(col, naive, pa.timestamp("ns")),
+            self._cast_iso(col, offset, pa.timestamp("ns", tz="UTC")),
+        )
+        # DATE_FORMATS only see non-ISO cells: strptime would roll an invalid ISO date like 2023-02-30 into March
+        rest = pc.if_else(pc.or_(naive, offset), pa.scalar(None, pa.string()), col)
+        if rest.null_count < len(rest):
+            parsed = [pc.strptime(rest, format=fmt, unit="ns", error_is_null=True) for fmt in self.DATE_FORMATS]
+            out = pc.coalesce(out, *parsed)
+        return out
+
+    @staticmethod
+    def _cast_iso(col: pa.ChunkedArray, mask: pa.ChunkedArray, ts_type: pa.DataType) -> pa.ChunkedArray:
+        """Cast the values where `mask` is set to `ts_type` (others become null); returned as naive timestamp[ns]."""
+        matched = pc.if_else(mask, col, pa.scalar(None, pa.string()))
+        try:
+            return pc.cast(pc.cast(matched, ts_type), pa.timestamp("ns"))
+        except pa.ArrowInvalid:
+            # right shape but not a real date (e.g. 2023-02-30): let pandas null out just those cells
+            coerced = pd.to_datetime(matched.to_pandas(), errors="coerce", format="ISO8601", utc=True)
+            return pa.chunked_array([pa.array(coerced.dt.tz_localize(None), type=pa.timestamp("ns"), from_pandas=True)])
+
+    def _primary_date_col(self, view: TableView) -> Optional[str]:
+        """First parsed date candidate (dcol_ts) with at least one non-null value; the load sorts on it."""
+        for c in self.DATE_CANDIDATES:
+            name = f"{c}_ts"
+            if name in view.column_names and view.column(name).null_count < len(view):
+                return name
+        return None
+
+    def filter_by_date(self, view: TableView, start_date: Optional[str], end_date: Optional[str]) -> TableView:
         """
         Filter using the first available parsed timestamp column (dcol_ts) or raw candidate date column.
         Accepts ISO strings for start_date/end_date.
         """
-        parsed_candidates = [f"{c}_ts" for c in self.DATE_CANDIDATES if f"{c}_ts" in df.columns]
-        raw_candidates = [c for c in self.DATE_CANDIDATES if c in df.columns]
-
-        candidate = parsed_candidates[0] if parsed_candidates else (raw_candidates[0] if raw_candidates else None)
+        raw_candidates = [c for c in self.DATE_CANDIDATES if c in view.column_names]
+        candidate = self._primary_date_col(view) or (raw_candidates[0] if raw_candidates else None)
         if not candidate:
-            return df
-
-        ser = pd.to_datetime(df[candidate], errors="coerce", infer_datetime_format=True)
-        mask = pd.Series(True, index=df.index)
-        if start_date:
-            start_dt = pd.to_datetime(start_date, errors="coerce")
-            if pd.notna(start_dt):
-                mask &= ser >= start_dt
-        if end_date:
-            end_dt = pd.to_datetime(end_date, errors="coerce")
-            if pd.notna(end_dt):
-                mask &= ser <= end_dt
-        filtered = df[mask.fillna(False)]
+            return view
+
+        start_dt = pd.to_datetime(start_date, errors="coerce") if start_date else pd.NaT
+        end_dt = pd.to_datetime(end_date, errors="coerce") if end_date else pd.NaT
+
+        if candidate == view.sorted_by and view.sort_keys is not None:
+            # table is sorted on this column: binary search the bounds, O(log N) + a zero-copy slice
+            ts = view.sort_keys
+            lo = np.searchsorted(ts, np.datetime64(start_dt, "ns").view("i8"), side="left") if pd.notna(start_dt) else 0
+            hi = np.searchsorted(ts, np.datetime64(end_dt, "ns").view("i8"), side="right") if pd.notna(end_dt) else len(ts)
+            filtered = view.slice(int(lo), int(max(hi - lo, 0)))
+            logger.info(f"Filtered on '{candidate}' between {start_date} and {end_date}: {len(filtered)} rows")
+            return filtered
+
+        col = view.column(candidate)
+        if pa.types.is_timestamp(col.type):
+            values = pc.cast(col, pa.timestamp("ns")).to_numpy()
+        else:
+            parsed = pd.to_datetime(col.to_pandas(), errors="coerce")
+            values = parsed.to_numpy(dtype="datetime64[ns]", na_value=np.datetime64("NaT"))
+        # plain numpy booleans: NaT compares False, so no NaN-propagating mask or fillna is needed
+        mask = np.ones(len(values), dtype=bool)
+        if pd.notna(start_dt):
+            mask &= values >= np.datetime64(start_dt, "ns")
+        if pd.notna(end_dt):
+            mask &= values <= np.datetime64(end_dt, "ns")
+        filtered = view.take(np.flatnonzero(mask))
         logger.info(f"Filtered on '{candidate}' between {start_date} and {end_date}: {len(filtered)} rows")
         return filtered
@@ -1,13 +1,15 @@
 import os
+import asyncio
+import hashlib
 import logging
-from typing import Optional
+from contextlib import asynccontextmanager
+from typing import Iterator, Optional
 
-import pandas as pd
+import orjson
 from fastapi import FastAPI, Query, HTTPException, Header, Depends
-from fastapi.responses import JSONResponse
-from fastapi.encoders import jsonable_encoder
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
 
-from app.data_loader import DataLoader
+from app.data_loader import DataLoader, TableView
 
 # --------------------------------------------------
 # Logging
@@ -24,7 +26,24 @@ EXPECTED_API_KEY = os.getenv("API_KEY", "changeme")
 # --------------------------------------------------
 # App initialization
 # --------------------------------------------------
-app = FastAPI(title="Logistics Mock API (Local CSV backend)")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # pre-build missing Parquet side-caches so no request has to pay for a CSV parse
+    for table_name in EXPOSED_TABLES:
+        try:
+            if await asyncio.to_thread(loader.ensure_parquet, table_name):
+                log.info("Built parquet cache for %s", table_name)
+        except FileNotFoundError:
+            log.warning("Exposed table %s has no CSV in '%s'", table_name, DATA_DIR)
+        except Exception:
+            log.exception("Could not build parquet cache for %s", table_name)
+    yield
+
+app = FastAPI(
+    title="Logistics Mock API (Local CSV backend)",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
+)
 
 EXPOSED_TABLES = os.getenv(
     "EXPOSED_TABLES",
@@ -32,7 +51,8 @@ EXPOSED_TABLES = os.getenv(
 ).split(",")
 
 DATA_DIR = os.getenv("DATA_DIR", "data")
-loader = DataLoader(data_dir=DATA_DIR)
+CACHE_MAX_MB = int(os.getenv("CACHE_MAX_MB", "1024"))
+loader = DataLoader(data_dir=DATA_DIR, cache_max_bytes=CACHE_MAX_MB * 1024 * 1024)
 
 # --------------------------------------------------
 # Dependencies
@@ -48,6 +68,28 @@ def verify_api_key(
 
     return True
 
+def stream_records(view: TableView, header: dict) -> Iterator[bytes]:
+    """Same JSON document as the paged response (`header` fields, then "data"), encoded batch by batch."""
+    yield orjson.dumps(header)[:-1] + b',"data":['
+    first = True
+    for rows in view.iter_pylist():
+        if not rows:
+            continue
+        yield (b"" if first else b",") + b",".join(orjson.dumps(row) for row in rows)
+        first = False
+    yield b"]}"
+
+def make_etag(table_name: str, meta: dict, *params) -> str:
+    """Responses are a pure function of the CSV (mtime + size), its load, and the query parameters."""
+    key = ":".join(str(p) for p in (table_name, meta["mtime"], meta["size"], meta["ingest_ts"], *params))
+    return '"' + hashlib.blake2b(key.encode(), digest_size=16).hexdigest() + '"'
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    tags = [t.strip() for t in if_none_match.split(",")]
+    return "*" in tags or etag in tags or f"W/{etag}" in tags
+
 # --------------------------------------------------
 # Health check
 # --------------------------------------------------
@@ -82,13 +124,14 @@ def table_schema(
 # Query table data
 # --------------------------------------------------
 @app.get("/api/{table_name}")
-def query_table(
+async def query_table(
     table_name: str,
     start_date: Optional[str] = Query(None),
     end_date: Optional[str] = Query(None),
     limit: int = Query(1000, ge=1, le=10000),
     offset: int = Query(0, ge=0),
     full: bool = Query(False),
+    if_none_match: Optional[str] = Header(None),
     _auth: bool = Depends(verify_api_key)
 ):
     table_name = table_name.strip()
@@ -100,7 +143,7 @@ def query_table(
         )
 
     try:
-        df = loader.load_table(table_name)
+        view = await loader.aload_table(table_name)
     except FileNotFoundError:
         raise HTTPException(
             status_code=404,
@@ -110,27 +153,32 @@ def query_table(
         log.exception("Error loading table %s", table_name)
         raise HTTPException(status_code=500, detail=str(e))
 
+    meta = loader.meta[table_name]
+    etag = make_etag(table_name, meta, offset, limit, start_date, end_date, full)
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+
     if start_date or end_date:
         try:
-            df = loader.filter_by_date(df, start_date, end_date)
+            view = await asyncio.to_thread(loader.filter_by_date, view, start_date, end_date)
         except Exception:
             log.warning("Date filter failed for %s", table_name)
 
-    if not full:
-        df = df.iloc[offset : offset + limit]
-
-    for col in df.columns:
-        if pd.api.types.is_datetime64_any_dtype(df[col]):
-            df[col] = df[col].dt.strftime("%Y-%m-%dT%H:%M:%S")
-
-    df = df.where(pd.notnull(df), None)
+    if full:
+        log.info("Streaming table=%s rows=%d", table_name, len(view))
+        header = {"count": len(view), "offset": offset, "limit": limit, "ingest_ts": meta["ingest_ts"]}
+        return StreamingResponse(
+            stream_records(view, header), media_type="application/json", headers={"ETag": etag}
+        )
 
-    records = df.to_dict(orient="records")
+    # first page of a table materializes its derived columns; keep that off the event loop
+    records = await asyncio.to_thread(view.to_pylist, offset, limit)
 
     response = {
         "count": len(records),
         "offset": offset,
         "limit": limit,
+        "ingest_ts": meta["ingest_ts"],
         "data": records
     }
 
@@ -142,4 +190,5 @@ def query_table(
         limit
     )
 
-    return JSONResponse(content=jsonable_encoder(response))
+    # returned as a Response so FastAPI skips jsonable_encoder on the records
+    return ORJSONResponse(content=response, headers={"ETag": etag})
@@ -6,4 +6,5 @@ class PagingResponse(BaseModel):
     count: int
     offset: int
     limit: int
+    ingest_ts: str
     data: List[Any]
@@ -0,0 +1,71 @@
+# tests/test_data_loader.py
+# run with: python -m unittest discover tests
+import os
+import tempfile
+import unittest
+
+from app.data_loader import DataLoader
+
+
+class DataLoaderTestCase(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.loader = DataLoader(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def write_csv(self, table_name: str, text: str) -> None:
+        with open(os.path.join(self.tmp.name, f"{table_name}.csv"), "w", newline="") as fh:
+            fh.write(text)
+
+
+class ReadCsvTests(DataLoaderTestCase):
+    def test_rows_with_wrong_field_count_are_skipped(self):
+        self.write_csv("t", "id,a,b\n1,x,y\n2,x\n3,p,q\n")
+        with self.assertLogs("data_loader", level="WARNING"):
+            rows = self.loader.load_table("t").to_pylist()
+        self.assertEqual([r["id"] for r in rows], ["1", "3"])
+
+
+class ToTimestampTests(DataLoaderTestCase):
+    def test_one_bad_cell_only_nulls_that_cell(self):
+        self.write_csv(
+            "events",
+            "event_id,scheduled_datetime\n"
+            "1,2022-01-02 18:00:00.000000\n"
+            "2,2022-01-01 18:00:00.000000\n"
+            "3,N/A\n",
+        )
+        view = self.loader.load_table("events")
+        self.assertEqual(self.loader.meta["events"]["sort_col"], "scheduled_datetime_ts")
+        rows = view.to_pylist()
+        self.assertEqual(
+            [r["scheduled_datetime_ts"] for r in rows],
+            ["2022-01-01T18:00:00", "2022-01-02T18:00:00", None],
+        )
+
+    def test_utc_offsets_are_converted_to_naive_utc(self):
+        self.write_csv(
+            "events",
+            "event_id,scheduled_datetime\n"
+            "1,2024-01-05T10:00:00Z\n"
+            "2,2024-01-05T12:30:00+02:00\n"
+            "3,2024-01-05 09:00:00\n",
+        )
+        rows = self.loader.load_table("events").to_pylist()
+        self.assertEqual(
+            [r["scheduled_datetime_ts"] for r in rows],
+            ["2024-01-05T09:00:00", "2024-01-05T10:00:00", "2024-01-05T10:30:00"],
+        )
+
+
+class ToPylistTests(DataLoaderTestCase):
+    def test_fractional_seconds_are_floored_before_1970(self):
+        self.write_csv("events", "event_id,scheduled_datetime\n1,1969-12-31 23:59:59.5\n2,2022-01-01 10:21:47.625320\n")
+        rows = self.loader.load_table("events").to_pylist()
+        self.assertEqual([r["scheduled_datetime_ts"] for r in rows], ["1969-12-31T23:59:59", "2022-01-01T10:21:47"])
+
+
+if __name__ == "__main__":
+    unittest.main()